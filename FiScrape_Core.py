@@ -11,43 +11,49 @@ Modules and classes:
 - Exporter: Exports the analyzed data to CSV files.
 """
 
+import csv
+import hashlib
 import pandas as pd
 import random
-from time import sleep
-from bs4 import BeautifulSoup
+from time import monotonic, sleep
+from datetime import date
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Manager
+from multiprocessing.connection import wait
 import os
+import sys
 
 from selenium.common import TimeoutException, WebDriverException
 
 from fiscrape_logger import logger
+from fiscrape_io import load, read_csv
 from itertools import chain
 from math import floor
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlsplit
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
 
-# Setting options for pandas
-pd.options.display.float_format = '{:.0f}'.format
-pd.set_option('display.max_rows', None)
-pd.set_option('display.max_columns', None)
-pd.set_option('display.width', None)
-pd.set_option('display.max_colwidth', None)
-pd.option_context('display.precision', 5)
-
 
 class Driver:
     """
     A utility class for managing the creation and configuration of Selenium WebDriver instances.
 
+    Attributes:
+    - page_load_timeout: The number of seconds a page may take to load before the load is considered failed.
+
     Methods:
     - create_driver(head=None): Creates and returns a Selenium WebDriver instance with optional headless mode.
 
     """
+    page_load_timeout = 30
 
     @staticmethod
     def create_driver(head=None):
@@ -66,10 +72,19 @@ class Driver:
         opt.set_preference("dom.ipc.plugins.enabled.libflashplayer.so", "false")  # Disable Flash
         opt.set_preference("permissions.default.stylesheet", 2)  # Disable CSS
         opt.log.level = "fatal"  # Disable logging
-        opt.page_load_strategy = 'normal'  # Options: 'normal', 'eager', 'none'
+        # Note: with 'eager', driver.get() returns at DOMContentLoaded; the elements that are read are awaited
+        # explicitly (version indicator and 'Expand All' button)
+        opt.page_load_strategy = 'eager'  # Options: 'normal', 'eager', 'none'
         opt.set_preference("javascript.enabled", True)
         opt.set_preference("dom.webnotifications.enabled", False)
 
+        # Skip page assets that are never scraped: trackers and ads, web fonts, and media
+        opt.set_preference("privacy.trackingprotection.enabled", True)  # Block known ad and tracking hosts
+        opt.set_preference("privacy.trackingprotection.socialtracking.enabled", True)
+        opt.set_preference("gfx.downloadable_fonts.enabled", False)  # Disable web fonts
+        opt.set_preference("media.autoplay.default", 5)  # Block autoplay of all media
+        opt.set_preference("media.autoplay.blocking_policy", 2)
+
         # Enable WebGL and GPU acceleration
         opt.add_argument('--enable-webgl')
         opt.add_argument('--enable-gpu')
@@ -80,7 +95,7 @@ class Driver:
         # Create WebDriver with the customized profile
         driver = webdriver.Firefox(options=opt)
         driver.delete_all_cookies()
-        driver.set_page_load_timeout(30)  # Adjust as necessary
+        driver.set_page_load_timeout(Driver.page_load_timeout)
 
         return driver
 
@@ -160,11 +175,11 @@ class Ticker:
         :return: A dictionary containing all attributes of the ticker.
         :rtype: dict
         """
-        for attr in dir(self):
-            if not attr.startswith('__') and attr not in ['set_attr', 'get_attr', 'data', 'get_all_attr',
-                                                          'summary_link', 'statistics_link', 'fs_link', 'profile_link',
-                                                          'holders_link']:
-                self.data.update({attr: getattr(self, attr)})
+        # Note: only the instance attributes hold ticker data
+        for attr, value in vars(self).items():
+            if not attr.startswith('__') and attr not in ['data', 'summary_link', 'statistics_link', 'fs_link',
+                                                          'profile_link', 'holders_link']:
+                self.data[attr] = value
         return self.data
 
 
@@ -184,26 +199,96 @@ class Scraper:
     - sleep_time: The time to sleep between actions to mimic human behavior and avoid detection.
     - retries: The maximum number of retries allowed for loading pages.
     - max_click_retries: The maximum number of retries allowed for clicking elements on the page.
+    - max_backoff_time: The longest time to wait between two retries, in seconds.
+    - cache_dir: The directory where statistics and financials pages are cached for the day, or None to disable caching.
+    - recent_page_ttl: The number of seconds a page kept in memory by request(keep=True) may be reused for.
+    - recent_pages: The pages kept in memory, with the time they were downloaded.
+    - http_retries: The number of times the HTTP session retries a rate limited or failed request.
     - se_version_indicator: The HTML element tag used to identify the version of the page.
     - se_class_version_indicator: The class attribute associated with the version indicator element.
     - indicator_text: The text content that confirms the correct version of the page is loaded.
+    - version_indicator_css: The version indicator as a CSS selector.
+    - version_indicator_script: The script returning the text of every element matching a CSS selector.
+    - financials_header_row_css: The header row of the financial statements as a CSS selector.
+    - expand_all_button_locator: The (By.XPATH, expand_all_button_xpath) locator of the 'Expand All' button.
+    - *_strainer: SoupStrainers matching the cells of a table row, built once and reused for every row.
+    - financials_table_script: The script returning only the financial statement table of the page.
+    - expand_all_script: The script clicking 'Expand All' and returning the expanded financial statement table.
     - Various other attributes related to the HTML structure of Yahoo Finance pages.
 
     Methods:
-    - load_and_check_version(url, driver, ticker): Loads a URL and checks if the correct version of the page is loaded.
-    - find_expand_all_button(driver, ticker): Attempts to find and click the 'Expand All' button on financial pages.
+    - backoff_time(attempt): Returns the randomized, exponentially growing wait before a retry.
+    - get_session(): Returns the HTTP session of the current process.
+    - read_page_cache(url): Returns the page cached today for the URL, if any.
+    - write_page_cache(url, html): Caches the page for the URL for the rest of the day.
+    - side_tab_labels(soup): Returns the labels of the side tabs of a quote page.
+    - find_all_at_once(soup, selectors): Finds the tags matching several (tag name, class) selectors in one pass.
+    - load_and_check_version(url, driver, ticker, navigate=True): Loads a URL and checks if the correct version of the
+    page is loaded.
+    - open_in_tabs(driver, urls, ticker): Starts loading URLs in new tabs without waiting for them.
+    - wait_for_tab(driver, url, ticker): Waits for a tab opened by open_in_tabs to be showing its page.
+    - find_expand_all_button(driver, ticker): Attempts to find and click the 'Expand All' button on financial pages,
+    returning the expanded financial statement table.
+    - parse_financial_statement(html_expanded): Parses an expanded financial statement table into a DataFrame.
     - obtain_recommendation(recommended_ticker, number_of_recommendations=3, head=None): Obtains stock recommendations.
     - fundamentals(ticker, shared_dict, lock, head=None): Scrapes fundamental financial data for a given ticker.
     - profile(ticker, shared_dict, lock, head=None): Scrapes profile data for a given ticker.
     - holders(ticker, shared_dict, lock, head=None): Scrapes holders data for a given ticker.
     - insider_transactions(ticker, shared_dict, lock, head=None): Scrapes insider transactions data for a given ticker.
+    - run_processes(jobs, lock, max_processes): Runs each (scraping method, ticker) job in its own process, with a
+    bounded number of processes running at once.
     - scrape(ticker_string, target='fundamentals', max_processes_capacity=1): Scrapes data for multiple tickers
     using multiprocessing.
     """
+    # Note: kept small, since each retry may wait up to max_backoff_time plus the 30 second request timeout
+    http_retries = 3
+
+    # Returns the raw text content (as BeautifulSoup's .text would) of every element matching the CSS selector given
+    # as arguments[0]
+    version_indicator_script = \
+        'return Array.from(document.querySelectorAll(arguments[0]), element => element.textContent);'
+
+    # Returns the outerHTML of the smallest element holding both the header row and the content rows of a financial
+    # statement, or of the whole body if the header row is missing
+    financials_table_function = """
+        function financialsTable(headerRowSelector, contentRowSelector) {
+            let table = document.querySelector(headerRowSelector);
+            while (table && !table.querySelector(contentRowSelector)) {
+                table = table.parentElement;
+            }
+            return (table || document.body).outerHTML;
+        }
+    """
+    financials_table_script = financials_table_function + """
+        return financialsTable(arguments[0], arguments[1]);
+    """
+
+    # Clicks the 'Expand All' button (XPath in arguments[0]) and polls in the page until more content rows
+    # (arguments[1]) are rendered or arguments[3] milliseconds have passed, then returns the expanded table (header row
+    # in arguments[2]) along with whether new rows appeared, all in one WebDriver call
+    expand_all_script = financials_table_function + """
+        const [buttonXPath, contentRowSelector, headerRowSelector, timeout, done] = arguments;
+        const button = document.evaluate(
+            buttonXPath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        const priorRowCount = document.querySelectorAll(contentRowSelector).length;
+        const start = Date.now();
+        button.click();
+        const poll = setInterval(() => {
+            const expanded = document.querySelectorAll(contentRowSelector).length > priorRowCount;
+            if (expanded || Date.now() - start > timeout) {
+                clearInterval(poll);
+                done({html: financialsTable(headerRowSelector, contentRowSelector), expanded: expanded});
+            }
+        }, 100);
+    """
+
     def __init__(self,
                  sleep_time=random.uniform(0.5, 1.5),
                  retries=10,
                  max_click_retries=10,
+                 max_backoff_time=30,
+                 cache_dir=None,
+                 recent_page_ttl=60,
                  # Load and check
                  se_version_indicator='a',
                  se_class_version_indicator='rapid-noclick-resp opt-in-link',
@@ -276,13 +361,19 @@ class Scraper:
                  se_class_insider_purchase_cell='yf-1toamfi'
                  ):
         self.ticker_instances = {}  # Will contain all ticker data important for calculations and documentation
-        self.sleep_time = sleep_time
+        self.sleep_time = float(sleep_time)
         self.retries = retries
         self.max_click_retries = max_click_retries
+        self.max_backoff_time = max_backoff_time
+        self.cache_dir = cache_dir  # Note: page caching is disabled unless a directory is given
+        self.recent_page_ttl = recent_page_ttl
+        self.recent_pages = {}  # Will contain the pages kept in memory by request(keep=True), keyed by URL
         # Load and check
         self.se_version_indicator = se_version_indicator
         self.se_class_version_indicator = se_class_version_indicator
         self.indicator_text = indicator_text
+        # Version indicator as a CSS selector (tag.class1.class2)
+        self.version_indicator_css = f"{se_version_indicator}.{'.'.join(se_class_version_indicator.split())}"
         # Recommender
         self.se_ticker_and_name = se_ticker_and_name
         self.se_class_ticker_and_name = se_class_ticker_and_name
@@ -315,6 +406,8 @@ class Scraper:
         self.se_class_statistics_hgl_n_info_column = se_class_statistics_hgl_n_info_column
         # Financials page(s)
         self.expand_all_button_xpath = expand_all_button_xpath
+        # Locator of the 'Expand All' button
+        self.expand_all_button_locator = (By.XPATH, expand_all_button_xpath)
         self.se_financials_header_row = se_financials_header_row
         self.se_class_financials_header_row = se_class_financials_header_row
         self.se_financials_header_column = se_financials_header_column
@@ -323,6 +416,8 @@ class Scraper:
         self.se_class_financials_content_row = se_class_financials_content_row
         self.se_financials_content_column = se_financials_content_column
         self.se_class_financials_content_column = se_class_financials_content_column
+        self.financials_header_row_css = \
+            f"{se_financials_header_row}.{'.'.join(se_class_financials_header_row.split())}"
         self.se_sector_and_industry = se_sector_and_industry
         # Profile
         self.se_class_sector_and_industry = se_class_sector_and_industry
@@ -346,39 +441,222 @@ class Scraper:
         self.se_class_insider_purchase_header_cell = se_class_insider_purchase_header_cell
         self.se_insider_purchase_cell = se_insider_purchase_cell
         self.se_class_insider_purchase_cell = se_class_insider_purchase_cell
+        # Table cell matchers, shared by every table row
+        self.statistics_valuation_table_column_strainer = SoupStrainer(
+            se_statistics_valuation_table_column, class_=se_class_statistics_valuation_table_column)
+        self.statistics_hgl_n_info_column_strainer = SoupStrainer(
+            se_statistics_hgl_n_info_column, class_=se_class_statistics_hgl_n_info_column)
+        self.financials_content_column_strainer = SoupStrainer(
+            se_financials_content_column, class_=se_class_financials_content_column)
+        self.profile_content_column_strainer = SoupStrainer(
+            se_profile_content_column, class_=se_class_profile_content_column)
+        self.insider_purchase_cell_strainer = SoupStrainer(
+            se_insider_purchase_cell, class_=se_class_insider_purchase_cell)
         self.lock = multiprocessing.Lock()  # Lock for thread safety
+        # HTTP session of the current process (see get_session)
+        self.session = None
+        self.session_pid = None
+
+    def backoff_time(self, attempt):
+        """
+        Returns how long to wait before the given retry: `self.sleep_time` doubled for every earlier attempt, capped at
+        `self.max_backoff_time` and spread by a random factor between 0.5 and 1.5, so that retries come quickly after
+        a transient failure, back off under a persistent one, and do not fire in lockstep across processes.
+
+        :param attempt: The number of the retry, starting at 1.
+        :type attempt: int
+        :return: The number of seconds to wait.
+        :rtype: float
+        """
+        return min(self.max_backoff_time, self.sleep_time * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+    def read_page_cache(self, url):
+        """
+        Returns the HTML of the page cached today for the specified URL. Statistics and financial statements only change
+        with new filings, so a page cached earlier the same day is reused.
+
+        :param url: The URL of the cached page.
+        :type url: str
+        :return: The cached HTML, or None if caching is disabled or the page has not been cached today.
+        :rtype: str or None
+        """
+        if self.cache_dir is None:
+            return None
+
+        cache_path = Scraper.page_cache_path(self.cache_dir, url)
+        if not os.path.exists(cache_path):
+            return None
+
+        logger.info(f'Using cached page {cache_path} for {url}.')
+        with open(cache_path, 'r', encoding='utf-8') as cache_file:
+            return cache_file.read()
+
+    def write_page_cache(self, url, html):
+        """
+        Caches the HTML of the page for the specified URL until the end of the day, and removes the pages cached on
+        earlier days. Does nothing if caching is disabled.
+
+        :param url: The URL of the page.
+        :type url: str
+        :param html: The HTML of the page.
+        :type html: str
+        """
+        if self.cache_dir is None:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cache_path = Scraper.page_cache_path(self.cache_dir, url)
+        # Note: the page is written to a temporary file first so that a concurrent reader never sees a partial page
+        temporary_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as cache_file:
+            cache_file.write(html)
+        os.replace(temporary_path, cache_path)
+
+        # Expired pages are never read again, since the cache file names start with the date they were cached on
+        today_prefix = f'{date.today().isoformat()}_'
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.html') and not entry.name.startswith(today_prefix):
+                try:
+                    os.remove(entry.path)
+                except OSError:  # Note: another scraping process may have removed it already
+                    pass
+
+    @staticmethod
+    def page_cache_path(cache_dir, url):
+        """
+        Builds the cache file path for the specified URL. The path includes today's date, so cached pages expire daily.
+
+        :param cache_dir: The cache directory.
+        :type cache_dir: str
+        :param url: The URL of the page.
+        :type url: str
+        :return: The path of the cache file.
+        :rtype: str
+        """
+        url_digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(cache_dir, f'{date.today().isoformat()}_{url_digest}.html')
 
-    def request(self, url, headers=None):
+    def get_session(self):
+        """
+        Returns the HTTP session of the current process, creating it on first use. Requests made by the same process
+        (e.g., the summary and statistics pages of a ticker) then reuse kept-alive connections, while a scraping
+        process never shares the sockets of the process it was forked from. The creation is not locked, so the first
+        call of a process must be made before requests are sent from several threads.
+
+        Responses that signal rate limiting or a server error (429, 500, 502, 503, 504) are retried up to
+        `Scraper.http_retries` times with an exponential backoff starting at `self.sleep_time` and capped at
+        `self.max_backoff_time`, so that concurrent scraping processes back off before the ticker fails. A Retry-After
+        header is ignored, as it could stall the scraping process for an unbounded time.
+
+        :return: The requests session of the current process.
+        :rtype: requests.Session
+        """
+        if self.session is None or self.session_pid != os.getpid():
+            self.session = requests.Session()
+            retry = Retry(total=Scraper.http_retries, backoff_factor=self.sleep_time,
+                          backoff_max=self.max_backoff_time, respect_retry_after_header=False,
+                          status_forcelist=(429, 500, 502, 503, 504), allowed_methods=frozenset({'GET'}))
+            self.session.mount('https://', HTTPAdapter(max_retries=retry))
+            self.session.mount('http://', HTTPAdapter(max_retries=retry))
+            self.session_pid = os.getpid()
+        return self.session
+
+    def request(self, url, headers=None, cache_check=None, parse_only=None, keep=False):
         """
         Sends an HTTP GET request to the specified URL and attempts to parse the HTML content using BeautifulSoup.
-        The method checks if the correct version of the webpage is loaded based on specific indicators within the HTML.
-        If the incorrect version is detected, it will retry the request up to `self.retries` times, with a pause
-        between each attempt defined by `self.sleep_time`.
+        Rate limited and failed requests are retried by the session (see get_session).
 
         :param url: The URL to send the GET request to.
         :type url: str
         :param headers: Optional HTTP headers to include in the request. Defaults to a user-agent header mimicking
         a standard browser.
         :type headers: dict, optional
-        :return: A BeautifulSoup object representing the parsed HTML content if the correct version is detected.
-                 Raises a ValueError if the maximum retries are reached without loading the correct version.
-        :rtype: BeautifulSoup or None
-        :raises ValueError: If the incorrect version of the webpage is loaded after all retry attempts.
+        :param cache_check: Enables the page cache (see cache_dir) for this page. The page may be served from the cache,
+        and a downloaded page is only saved to it if cache_check(soup) is true for its parsed tree, so that an
+        incomplete page (e.g., a consent page) is never cached.
+        :type cache_check: callable, optional
+        :param parse_only: Restricts the parsed tree to the matching tags and their contents, for pages where only one
+        kind of element is read.
+        :type parse_only: SoupStrainer, optional
+        :param keep: Whether to keep the downloaded page in memory for `self.recent_page_ttl` seconds, so that a later
+        request of the same URL (including one made by a scraping process started afterward) reuses it.
+        :type keep: bool, optional
+        :return: A BeautifulSoup object representing the parsed HTML content.
+        :rtype: BeautifulSoup
+        :raises requests.exceptions.RequestException: If the page still cannot be loaded after all retry attempts.
         """
         if headers is None:
             headers = {'User-agent': 'Mozilla/5.0'}
 
-        for attempt in range(self.retries):
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            soup = BeautifulSoup(response.text, 'lxml')
+        if cache_check is not None:
+            html = self.read_page_cache(url)
+            if html is not None:
+                return BeautifulSoup(html, 'lxml', parse_only=parse_only)
+
+        recent_page = self.recent_pages.get(url)
+        if recent_page is not None:
+            downloaded_at, content, encoding = recent_page
+            if monotonic() - downloaded_at < self.recent_page_ttl:
+                logger.info(f'Reusing the page downloaded {monotonic() - downloaded_at:.1f} seconds ago for {url}.')
+                return BeautifulSoup(content, 'lxml', from_encoding=encoding, parse_only=parse_only)
+
+        # Note: without a timeout a stalled connection would hang the scraping process forever; 30 seconds matches the
+        # page load timeout of the WebDriver
+        response = self.get_session().get(url, headers=headers, timeout=30)
+        response.raise_for_status()  # Raise an exception for HTTP errors
+        if keep:
+            self.recent_pages[url] = (monotonic(), response.content, response.encoding)
+        # Note: the raw bytes are handed straight to lxml, which decodes them itself
+        soup = BeautifulSoup(response.content, 'lxml', from_encoding=response.encoding, parse_only=parse_only)
+        if cache_check is not None and cache_check(soup):
+            self.write_page_cache(url, response.text)
+        return soup
+
+    @staticmethod
+    def side_tab_labels(soup):
+        """
+        Returns the labels of the side tabs (e.g., 'Statistics', 'Financials') of a quote page. A page without side
+        tabs was not fully loaded.
+
+        :param soup: The parsed quote page.
+        :type soup: BeautifulSoup
+        :return: The side tab labels.
+        :rtype: set
+        """
+        return {entry.text.strip() for entry in soup.select('a[category]')}
+
+    @staticmethod
+    def find_all_at_once(soup, selectors):
+        """
+        Finds the tags matching each (tag name, class) selector in a single traversal of the parse tree. A class
+        matches the same way as find_all(name, class_=...): either the tag's full class attribute or one of its
+        individual classes.
+
+        :param soup: The parsed page to search.
+        :type soup: BeautifulSoup
+        :param selectors: The (tag name, class) pairs to look for.
+        :type selectors: list of tuple
+        :return: A list of matching tags for each selector, in document order and in the order of the selectors.
+        :rtype: list of list
+        """
+        matches = {selector: [] for selector in selectors}
+        classes_by_name = {}
+        for name, class_name in matches:
+            classes_by_name.setdefault(name, []).append(class_name)
 
-            return soup  # Correct version detected
+        for tag in soup.find_all(list(classes_by_name)):
+            tag_classes = tag.get('class') or []
+            full_class = ' '.join(tag_classes)
+            for class_name in classes_by_name[tag.name]:
+                if class_name == full_class or class_name in tag_classes:
+                    matches[(tag.name, class_name)].append(tag)
 
-    def load_and_check_version(self, url, driver, ticker):
+        return [matches[selector] for selector in selectors]
+
+    def load_and_check_version(self, url, driver, ticker, navigate=True):
         """
         Loads the specified URL in the given WebDriver instance and checks if the correct version of the page is loaded.
-        If the page is not correctly loaded, logs an error and returns None.
+        If the page is not correctly loaded, logs an error and returns False.
 
         This method does not create a separate retry mechanism to ensure that the WebDriver instance is reused
         consistently throughout the scraping process. Reusing the same WebDriver helps in preventing the loading
@@ -391,73 +669,182 @@ class Scraper:
         :type driver: webdriver.Firefox
         :param ticker: The stock ticker symbol associated with the page being loaded.
         :type ticker: str
-        :return: A BeautifulSoup object if the correct version of the page is loaded, otherwise None.
-        :rtype: BeautifulSoup or None
+        :param navigate: Whether to load the URL first. Set to False when the URL is already loading in the current
+        window (e.g., a tab opened by open_in_tabs).
+        :type navigate: bool, optional
+        :return: True if the correct version of the page is loaded, otherwise False.
+        :rtype: bool
         """
         try:
-            driver.get(url)
-            html = driver.execute_script('return document.body.innerHTML;')
-            soup = BeautifulSoup(html, 'lxml')
+            if navigate:
+                driver.get(url)
 
-            sleep(float(self.sleep_time))
+            # Note: with the 'eager' page load strategy the page may still be loading here, so the check waits until
+            # either the version indicator appears or the page has fully loaded (i.e., the indicator will not appear)
+            try:
+                WebDriverWait(driver, Driver.page_load_timeout).until(
+                    lambda d: d.find_elements(By.CSS_SELECTOR, self.version_indicator_css)
+                    or d.execute_script('return document.readyState;') == 'complete')
+            except TimeoutException:
+                logger.info(f'{ticker}: Page still loading after {Driver.page_load_timeout} seconds.')
 
             # Check for the correct version
-            indicator_texts = [entry.text for entry in soup.find_all(
-                self.se_version_indicator, class_=self.se_class_version_indicator)]
+            # Note: only the indicator texts are returned by the browser, since the page content is read once it has
+            # been expanded; the whole body is neither serialized nor parsed here
+            indicator_texts = driver.execute_script(self.version_indicator_script, self.version_indicator_css)
 
             if self.indicator_text in indicator_texts:
-                return soup  # Correct version detected
+                return True  # Correct version detected
             else:
                 logger.error(f'{ticker}: Incorrect version detected.')
-                return None
+                return False
 
         except TimeoutException as te:
             logger.error(f'{ticker}: Timeout while loading the page - {te}.')
-            return None
+            return False
 
         except WebDriverException as we:
             logger.error(f'{ticker}: WebDriver exception occurred - {we}.')
-            return None
+            return False
 
         except Exception as e:
             logger.error(f'{ticker}: General error occurred while loading the page - {e}.')
-            return None
+            return False
+
+    @staticmethod
+    def open_in_tabs(driver, urls, ticker):
+        """
+        Starts loading each URL in a new tab of the WebDriver without waiting for the pages to load, then switches back
+        to the current window. If a tab cannot be opened, logs a warning and returns the tabs opened so far; the
+        remaining URLs are then simply loaded when they are needed.
+
+        :param driver: The WebDriver instance to open the tabs in.
+        :type driver: webdriver.Firefox
+        :param urls: The URLs to start loading.
+        :type urls: list
+        :param ticker: The stock ticker symbol associated with the pages being loaded.
+        :type ticker: str
+        :return: A dictionary mapping each URL to the handle of the tab it is loading in.
+        :rtype: dict
+        """
+        current_window = driver.current_window_handle
+        windows = {}
+        try:
+            for url in urls:
+                driver.switch_to.new_window('tab')
+                # Note: assigning the location returns right away, unlike driver.get() which waits for the page
+                driver.execute_script('window.location.href = arguments[0];', url)
+                windows[url] = driver.current_window_handle
+        except WebDriverException as e:
+            logger.warning(f'{ticker}: Could not open a tab in advance - {e}.')
+        driver.switch_to.window(current_window)
+        return windows
+
+    @staticmethod
+    def wait_for_tab(driver, url, ticker):
+        """
+        Waits, for at most the page load timeout, until the current tab (opened by open_in_tabs) has left about:blank
+        for the specified URL and its document has been parsed. A redirect that only adds or drops a trailing slash
+        still counts as the URL.
+
+        :param driver: The WebDriver instance, switched to the tab.
+        :type driver: webdriver.Firefox
+        :param url: The URL the tab is loading.
+        :type url: str
+        :param ticker: The stock ticker symbol associated with the page being loaded.
+        :type ticker: str
+        :return: True if the tab is showing the page, False otherwise.
+        :rtype: bool
+        """
+        target_path = urlsplit(url).path.rstrip('/')
+        try:
+            WebDriverWait(driver, Driver.page_load_timeout).until(
+                lambda d: urlsplit(d.current_url).path.rstrip('/') == target_path
+                and d.execute_script('return document.readyState;') != 'loading')
+        except WebDriverException:  # Note: TimeoutException is a WebDriverException too
+            logger.info(f'{ticker}: The tab opened in advance did not load {url}.')
+            return False
+        return True
 
     def find_expand_all_button(self, driver, ticker):
         """
-        Attempts to find and click the 'Expand All' button on the financials page. If the button cannot be clicked
-        after the maximum number of retries, logs an error and returns False.
+        Attempts to find and click the 'Expand All' button on the financials page, then returns the expanded financial
+        statement table. If the button never becomes clickable, or the click still fails after the maximum number of
+        retries, logs an error and returns None.
 
         :param driver: The WebDriver instance to use for finding and clicking the button.
         :type driver: webdriver.Firefox
         :param ticker: The stock ticker symbol associated with the page being interacted with.
         :type ticker: str
-        :return: True if the 'Expand All' button was successfully clicked, otherwise False.
-        :rtype: bool
+        :return: The HTML of the expanded financial statement table if the 'Expand All' button was successfully
+        clicked, otherwise None.
+        :rtype: str or None
         """
         click_retry_count = 0
         logger.info(f"{ticker}: Attempting to find and click the 'Expand All' button.")
 
         while click_retry_count < self.max_click_retries:
+            # Wait for the 'Expand All' button to be rendered
+            try:
+                WebDriverWait(driver, 20).until(ec.element_to_be_clickable(self.expand_all_button_locator))
+            except TimeoutException:
+                # Note: the button did not become clickable within the explicit wait above, so waiting and retrying
+                # again (up to max_click_retries more times) would only repeat the same wait on a page without it
+                logger.error(f"{ticker}: 'Expand All' button did not become clickable within 20 seconds.")
+                return None
+
             try:
-                # Attempt to locate and click the 'Expand All' button
-                expand_all_button = WebDriverWait(driver, 20).until(
-                    ec.element_to_be_clickable((By.XPATH, self.expand_all_button_xpath)))
+                # Note: the click, the wait for the expanded rows and the table HTML are a single WebDriver call;
+                # sleep_time bounds the wait, for statements without collapsible rows
+                expansion = driver.execute_async_script(
+                    self.expand_all_script, self.expand_all_button_xpath, self.se_class_financials_content_row,
+                    self.financials_header_row_css, self.sleep_time * 1000)
 
-                expand_all_button.click()
-                sleep(self.sleep_time)
+                if not expansion['expanded']:
+                    logger.info(f"{ticker}: No new rows appeared within {self.sleep_time} seconds of expanding.")
 
                 logger.info(f"{ticker}: 'Expand All' button clicked successfully.")
-                return True  # Success
-            except (TimeoutException, WebDriverException) as e:
+                return expansion['html']  # Success
+            except WebDriverException as e:
                 click_retry_count += 1
                 logger.warning(
                     f"{ticker}: Attempt {click_retry_count} - Failed to click 'Expand All' button due to {e}."
                     f" Retrying...")
-                sleep(self.sleep_time)
+                sleep(self.backoff_time(click_retry_count))  # Give whatever interfered with the click time to go away
 
         logger.error(f"{ticker}: Failed to click the 'Expand All' button after {self.max_click_retries} attempts.")
-        return False  # Failed after max retries
+        return None  # Failed after max retries
+
+    def parse_financial_statement(self, html_expanded):
+        """
+        Parses the table of an expanded financial statement page (income statement, balance sheet or cash flow) into
+        a DataFrame whose first row holds the headers.
+
+        :param html_expanded: The HTML of the expanded financial statement table.
+        :type html_expanded: str
+        :return: A DataFrame containing the financial statement.
+        :rtype: pd.DataFrame
+        """
+        soup_expanded = BeautifulSoup(html_expanded, 'lxml')
+
+        # Generating the header for the financial statements
+        fs_header_row = soup_expanded.find_all(self.se_financials_header_row,
+                                               class_=self.se_class_financials_header_row)
+        # Note: only the main headers are extracted without other features
+        fs_header_row = fs_header_row[0]
+        fs_header = [entry.text for entry in fs_header_row.find_all(self.se_financials_header_column)]
+        raw_fs_table = [fs_header]  # Note: The raw financial table begins with the headers
+
+        # Generating the contents for the financial statements
+        # (Note: splicing is used to pop repetitive column)
+        fs_content = soup_expanded.select(self.se_class_financials_content_row)
+
+        raw_fs_table.extend([entry.text for entry in
+                             fs_row.find_all(self.financials_content_column_strainer)][1:]
+                            for fs_row in fs_content)
+
+        # Note: a fresh DataFrame is built for every statement, so it is handed over without copying
+        return pd.DataFrame(raw_fs_table)
 
     def obtain_recommendation(self, recommended_ticker, number_of_recommendations=3):
         """
@@ -473,14 +860,19 @@ class Scraper:
 
         logger.info(f"{recommended_ticker}: Starting to obtain recommendations.")
         try:
-            soup = Scraper.request(self, Ticker(recommended_ticker).summary_link)
+            # Note: only the recommendation links (and the tickers inside them) are built into the tree; the page is
+            # kept since the recommended tickers (starting with this one) are usually scraped right afterward, when
+            # fundamentals() can reuse it
+            soup = Scraper.request(self, Ticker(recommended_ticker).summary_link,
+                                   parse_only=SoupStrainer(self.se_ticker_and_name,
+                                                           class_=self.se_class_ticker_and_name),
+                                   keep=True)
 
             recommendation_content = [entry for entry in soup.find_all(self.se_ticker_and_name,
                                                                        class_=self.se_class_ticker_and_name)]
 
-            recommended_ticker_outputs = [[entry.text for entry in
-                                           recommendation_content[recommendation_iteration].find_all(self.se_ticker)]
-                                          for recommendation_iteration in range(len(recommendation_content))
+            recommended_ticker_outputs = [[entry.text for entry in recommendation.find_all(self.se_ticker)]
+                                          for recommendation in recommendation_content
                                           ][:number_of_recommendations + 1]
 
             recommended_ticker_outputs = list(chain(*recommended_ticker_outputs))
@@ -517,7 +909,8 @@ class Scraper:
         :type head: any, optional
         """
         logger.info(f"{ticker}: Starting fundamentals scraping.")
-        driver = Driver.create_driver(head)
+        driver = None
+        driver_future = None
         try:
             # Initialize variables that might not be available (e.g., index funds)
             df_statistics_valuations = None
@@ -528,72 +921,88 @@ class Scraper:
 
             logger.info(f"{ticker}: Price, change, and summary scraping initiated.")
 
-            # Loading the summary page
-            soup = Scraper.request(self, Ticker(ticker).summary_link)
+            # Every page link of the ticker
+            ticker_links = Ticker(ticker)
+
+            # The expanded financials pages are only loaded through the driver when they have not been cached today
+            cached_pages = {fs_link: self.read_page_cache(fs_link) for fs_link in ticker_links.fs_link}
+            # Note: Firefox starts up in the background while the summary and statistics pages load, and is not
+            # started at all when every financial statement is cached
+            if None in cached_pages.values():
+                driver_executor = ThreadPoolExecutor(max_workers=1)
+                driver_future = driver_executor.submit(Driver.create_driver, head)
+                driver_executor.shutdown(wait=False)
+
+            # Loading the summary page, while the statistics page (which does not depend on it) loads in the background
+            # Note: the session is created before the worker thread starts, since creating it is not thread safe
+            self.get_session()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                statistics_future = executor.submit(Scraper.request, self, ticker_links.statistics_link,
+                                                    cache_check=Scraper.side_tab_labels)
+                soup = Scraper.request(self, ticker_links.summary_link)
+
+            # Every element used from the summary page is collected in one pass over the page
+            name_tags, price_tags, change_tags, summary_label_tags, summary_content_tags = Scraper.find_all_at_once(
+                soup, [(self.se_name, self.se_class_name),
+                       (self.se_price, self.se_class_price),
+                       (self.se_change, self.se_class_change),
+                       (self.se_summary_label, self.se_class_summary_label),
+                       (self.se_summary_content, self.se_class_summary_content)])
 
             # Real-time price and change (also a good test whether the web version is loaded)
-            name = [entry.text for entry in soup.find(self.se_name, class_=self.se_class_name)]  # First one only!
-            price = [entry.text for entry in soup.find_all(self.se_price, class_=self.se_class_price)]
-            change = [entry.text for entry in soup.find_all(self.se_change, class_=self.se_class_change)]
+            name = [entry.text for entry in name_tags[0]]  # First one only!
+            price = [entry.text for entry in price_tags]
+            change = [entry.text for entry in change_tags]
 
             change_intraday = (change[0], change[1])
             change_afterhours = (change[2], change[3]) if len(change) > 2 else None
 
-            summary_label = [entry.text for entry in soup.find_all(
-                self.se_summary_label, class_=self.se_class_summary_label)]
-            summary_content = [entry.text for entry in soup.find_all(
-                self.se_summary_content, class_=self.se_class_summary_content)]
+            summary_label = [entry.text for entry in summary_label_tags]
+            summary_content = [entry.text for entry in summary_content_tags]
 
-            raw_summary_table = [[summary_label[summary_iteration], summary_content[summary_iteration]]
-                                 for summary_iteration in range(len(summary_label))]
-
-            df_summary = pd.DataFrame(raw_summary_table)
+            # Every summary label must have its content, otherwise the pairs below would be misaligned
+            if len(summary_label) != len(summary_content):
+                raise ValueError(f'{ticker}: Found {len(summary_label)} summary labels but {len(summary_content)} '
+                                 f'summary contents.')
+            df_summary = pd.DataFrame(list(zip(summary_label, summary_content)))
 
             logger.info(f"{ticker}: Price, change, and summary fetched successfully.")
 
             # Loading the statistics page
-            soup = Scraper.request(self, Ticker(ticker).statistics_link)
+            soup = statistics_future.result()
 
             # Identifying whether statistics & financial information are available through the side tabs
-            side_tab_labels = [entry.text.strip() for entry in soup.select('a[category]')]
+            side_tab_labels = Scraper.side_tab_labels(soup)
 
             # Statistics valuation table generator if "Statistics" tab is present
             if 'Statistics' in side_tab_labels:
                 logger.info(f'{ticker}: Statistics scraping initiated.')
 
+                # The valuation header, valuation rows, and highlight rows are collected in one pass over the page
+                statistics_valuation_header_tags, statistics_valuation_table, statistics_hgl_n_info = (
+                    Scraper.find_all_at_once(soup, [
+                        (self.se_statistics_valuation_table_header, self.se_class_statistics_valuation_table_header),
+                        (self.se_statistics_valuation_table_row, self.se_class_statistics_valuation_table_row),
+                        (self.se_statistics_hgl_n_info_row, self.se_class_statistics_hgl_n_info_row)]))
+
                 # Generating the header for the statistics valuation table
-                statistics_valuation_header = [entry.text for entry in soup.find_all(
-                    self.se_statistics_valuation_table_header, class_=self.se_class_statistics_valuation_table_header)]
+                statistics_valuation_header = [entry.text for entry in statistics_valuation_header_tags]
                 statistics_valuation_header[0] = 'Breakdown'
 
-                # Generating the statistics valuation table
-                statistics_valuation_table = soup.find_all(self.se_statistics_valuation_table_row,
-                                                           class_=self.se_class_statistics_valuation_table_row)
-
                 # Note: the statistics valuation table begins with the header
                 raw_statistics_valuation_table = [statistics_valuation_header]
                 # Extract the individual elements from the row generated in statistics table
                 raw_statistics_valuation_table.extend([[entry.text.strip() for entry in
-                                                        statistics_valuation_table[valuation_iteration].find_all(
-                                                            self.se_statistics_valuation_table_column,
-                                                            class_=self.se_class_statistics_valuation_table_column)]
-                                                       for valuation_iteration in
-                                                       range(len(statistics_valuation_table))])
+                                                        valuation_row.find_all(
+                                                            self.statistics_valuation_table_column_strainer)]
+                                                       for valuation_row in statistics_valuation_table])
 
                 df_statistics_valuations = pd.DataFrame(raw_statistics_valuation_table)
 
-                # Cleaning up statistics valuation table
-                df_statistics_valuations_T = df_statistics_valuations.T  # Transpose
-                df_statistics_valuations = df_statistics_valuations_T.T
-
                 # Generating the statistics financial highlights
-                statistics_hgl_n_info = soup.find_all(self.se_statistics_hgl_n_info_row,
-                                                      class_=self.se_class_statistics_hgl_n_info_row)
                 raw_statistics_hgl_n_info = [[entry.text.strip() for entry in
-                                              statistics_hgl_n_info[statistics_iteration].find_all(
-                                                  self.se_statistics_hgl_n_info_column,
-                                                  class_=self.se_class_statistics_hgl_n_info_column)]
-                                             for statistics_iteration in range(len(statistics_hgl_n_info))]
+                                              statistics_row.find_all(self.statistics_hgl_n_info_column_strainer)]
+                                             for statistics_row in statistics_hgl_n_info]
                 df_statistics_hgl_n_info = pd.DataFrame(raw_statistics_hgl_n_info)
 
                 logger.info(f'{ticker}: Statistics scraping completed.')
@@ -602,59 +1011,62 @@ class Scraper:
 
             # Financials page scraping
             if 'Financials' in side_tab_labels:
-                for link_iteration in range(len(Ticker(ticker).fs_link)):
-                    # Try loading the financials page with retries
-                    for attempt in range(self.retries):
-                        logger.info(
-                            f"{ticker}: Attempt {attempt + 1} to load financials page "
-                            f"(link {link_iteration + 1}).")
-                        soup = self.load_and_check_version(Ticker(ticker).fs_link[link_iteration], driver, ticker)
-                        if soup is not None:
+                uncached_links = [fs_link for fs_link in ticker_links.fs_link if cached_pages[fs_link] is None]
+                prefetched_windows = {}
+                if uncached_links:
+                    driver = driver_future.result()  # Wait for the WebDriver started in the background
+                    # Note: every statement page after the first starts loading in its own tab right away, so that it
+                    # loads while the pages before it are checked and expanded
+                    prefetched_windows = Scraper.open_in_tabs(driver, uncached_links[1:], ticker)
+
+                for link_iteration, fs_link in enumerate(ticker_links.fs_link):
+                    html_expanded = cached_pages[fs_link]
+                    if html_expanded is None:
+                        # Try loading the financials page with retries
+                        for attempt in range(self.retries):
                             logger.info(
-                                f"{ticker}: Successfully loaded the financials page on attempt {attempt + 1} "
+                                f"{ticker}: Attempt {attempt + 1} to load financials page "
                                 f"(link {link_iteration + 1}).")
-                            break  # Break out of the loop if the correct version is loaded
-                        logger.warning(
-                            f"{ticker}: Failed to load the financials page on attempt {attempt + 1} "
-                            f"(link {link_iteration + 1}). Retrying...")
-                        driver.quit()
-                        driver = Driver.create_driver(head)  # Create a new driver for the next attempt
-                    else:
-                        raise Exception(
-                            f'{ticker}: Failed to load the correct financials page after {self.retries} retries.')
-
-                    # Initialize the maximum number of retries
-                    Scraper.find_expand_all_button(self, driver, ticker)
-
-                    html_expanded = driver.execute_script('return document.body.innerHTML;')
-                    soup_expanded = BeautifulSoup(html_expanded, 'lxml')
-
-                    # Generating the header for the financial statements
-                    fs_header_row = soup_expanded.find_all(self.se_financials_header_row,
-                                                           class_=self.se_class_financials_header_row)
-                    # Note: only the main headers are extracted without other features
-                    fs_header_row = fs_header_row[0]
-                    fs_header = [entry.text for entry in fs_header_row.find_all(self.se_financials_header_column)]
-                    raw_fs_table = [fs_header]  # Note: The raw financial table begins with the headers
-
-                    # Generating the contents for the financial statements
-                    # (Note: splicing is used to pop repetitive column)
-                    fs_content = soup_expanded.select(self.se_class_financials_content_row)
-
-                    raw_fs_table.extend([entry.text for entry in
-                                         fs_content[fs_iteration].find_all(
-                                             self.se_financials_content_column,
-                                             class_=self.se_class_financials_content_column)][1:]
-                                        for fs_iteration in range(len(fs_content)))
-
-                    df_financial_statement = pd.DataFrame(raw_fs_table)
-
-                    if 'financials' in Ticker(ticker).fs_link[link_iteration]:
-                        df_income_statement = df_financial_statement.copy()
-                    elif 'balance-sheet' in Ticker(ticker).fs_link[link_iteration]:
-                        df_balance_sheet = df_financial_statement.copy()
-                    elif 'cash-flow' in Ticker(ticker).fs_link[link_iteration]:
-                        df_cash_flow = df_financial_statement.copy()
+                            # A page already loading in its own tab is checked there once it has loaded; if the tab
+                            # never gets there, the page is loaded again in that tab
+                            prefetched_window = prefetched_windows.pop(fs_link, None)
+                            prefetched = False
+                            if prefetched_window is not None:
+                                driver.switch_to.window(prefetched_window)
+                                prefetched = Scraper.wait_for_tab(driver, fs_link, ticker)
+                            if self.load_and_check_version(fs_link, driver, ticker, navigate=not prefetched):
+                                logger.info(
+                                    f"{ticker}: Successfully loaded the financials page on attempt {attempt + 1} "
+                                    f"(link {link_iteration + 1}).")
+                                break  # Break out of the loop if the correct version is loaded
+                            logger.warning(
+                                f"{ticker}: Failed to load the financials page on attempt {attempt + 1} "
+                                f"(link {link_iteration + 1}). Retrying...")
+                            driver.quit()
+                            driver = Driver.create_driver(head)  # Create a new driver for the next attempt
+                            prefetched_windows.clear()  # Note: the tabs were closed along with the old driver
+                        else:
+                            raise Exception(
+                                f'{ticker}: Failed to load the correct financials page after {self.retries} retries.')
+
+                        # Note: only the statement table is serialized over the WebDriver connection, without the ads
+                        # and widgets of the page
+                        html_expanded = Scraper.find_expand_all_button(self, driver, ticker)
+                        if html_expanded is not None:
+                            self.write_page_cache(fs_link, html_expanded)
+                        else:  # Note: a page that failed to expand is read as is, but never cached
+                            html_expanded = driver.execute_script(self.financials_table_script,
+                                                                  self.financials_header_row_css,
+                                                                  self.se_class_financials_content_row)
+
+                    df_financial_statement = self.parse_financial_statement(html_expanded)
+
+                    if 'financials' in fs_link:
+                        df_income_statement = df_financial_statement
+                    elif 'balance-sheet' in fs_link:
+                        df_balance_sheet = df_financial_statement
+                    elif 'cash-flow' in fs_link:
+                        df_cash_flow = df_financial_statement
 
                     logger.info(f'{ticker}: Financial statements scraping completed for link {link_iteration + 1}.')
 
@@ -670,14 +1082,12 @@ class Scraper:
                     'price': price[0] if price[0] is not None else None,
                     'change_intraday': change_intraday if change_intraday is not None else None,
                     'change_afterhours': change_afterhours if change_afterhours is not None else None,
-                    'df_summary': df_summary.to_dict() if df_summary is not None else None,
-                    'df_statistics_valuations': df_statistics_valuations.to_dict() if
-                    df_statistics_valuations is not None else None,
-                    'df_statistics_highlights': df_statistics_hgl_n_info.to_dict() if
-                    df_statistics_hgl_n_info is not None else None,
-                    'df_income_statement': df_income_statement.to_dict() if df_income_statement is not None else None,
-                    'df_balance_sheet': df_balance_sheet.to_dict() if df_balance_sheet is not None else None,
-                    'df_cash_flow': df_cash_flow.to_dict() if df_cash_flow is not None else None
+                    'df_summary': df_summary,
+                    'df_statistics_valuations': df_statistics_valuations,
+                    'df_statistics_highlights': df_statistics_hgl_n_info,
+                    'df_income_statement': df_income_statement,
+                    'df_balance_sheet': df_balance_sheet,
+                    'df_cash_flow': df_cash_flow
                 }
                 logger.info(f'{ticker}: Shared dictionary updated successfully.')
 
@@ -685,7 +1095,11 @@ class Scraper:
             logger.error(f'{ticker}: An error occurred during scraping fundamentals - {e}.', exc_info=True)
 
         finally:
-            driver.quit()
+            # A WebDriver started in the background but never needed (e.g., no financials tab) is closed as well
+            if driver is None and driver_future is not None and driver_future.exception() is None:
+                driver = driver_future.result()
+            if driver is not None:
+                driver.quit()
             logger.info(f'{ticker}: Driver closed after fundamentals scraping.')
 
     def profile(self, ticker, shared_dict, lock):
@@ -725,10 +1139,8 @@ class Scraper:
                                                                 class_=self.se_class_profile_content_row)]
 
             raw_profile_table.extend([entry.text for entry in
-                                      profile_content[profile_iteration].find_all(
-                                          self.se_profile_content_column,
-                                          class_=self.se_class_profile_content_column)]
-                                     for profile_iteration in range(len(profile_content)))
+                                      profile_row.find_all(self.profile_content_column_strainer)]
+                                     for profile_row in profile_content)
 
             # Remove out useless and empty first two rows
             raw_profile_table = raw_profile_table[2:]
@@ -746,7 +1158,7 @@ class Scraper:
                     'industry': sector_and_industry[1] if len(sector_and_industry) > 1 else None,
                     'employees': employees[1]  # The second entry with structural element 'dd'
                     if employees is not None and len(employees) > 1 else None,
-                    'df_key_executives': df_key_executives.to_dict() if df_key_executives is not None else None
+                    'df_key_executives': df_key_executives
                 }
                 logger.info(f"{ticker}: Shared dictionary updated successfully with profile data.")
 
@@ -771,7 +1183,9 @@ class Scraper:
         logger.info(f"{ticker}: Starting holders data scraping.")
         try:
             # Try loading the holders page with retries
-            soup = Scraper.request(self, Ticker(ticker).holders_link)
+            # Note: only the major holders cells are built into the tree
+            soup = Scraper.request(self, Ticker(ticker).holders_link,
+                                   parse_only=SoupStrainer(self.se_major_holders, class_=self.se_class_major_holders))
 
             logger.info(f"{ticker}: Extracting major holders data from holders page.")
 
@@ -833,10 +1247,10 @@ class Scraper:
             insider_transaction_content = [entry for entry in soup.find_all(
                 self.se_insider_purchase_row, class_=self.se_class_insider_purchase_row)]
 
-            raw_insider_transaction.extend([entry.text for entry in insider_transaction_content[insider_iteration]
-                                           .find_all(self.se_insider_purchase_cell,
-                                                     class_=self.se_class_insider_purchase_cell)][:3]
-                                           for insider_iteration in range(1, len(insider_transaction_content) - 3))
+            raw_insider_transaction.extend([entry.text for entry in insider_row
+                                           .find_all(self.insider_purchase_cell_strainer)][:3]
+                                           for insider_row in insider_transaction_content[
+                                               1:len(insider_transaction_content) - 3])
             # Note: List splicing prevents spillover scraping, and minus 3 prevents scraping tables below
 
             df_insider_transactions = pd.DataFrame(raw_insider_transaction)
@@ -848,8 +1262,7 @@ class Scraper:
                 logger.info(f"{ticker}: Updating shared dictionary with insider transactions data.")
                 shared_dict[ticker] = {
                     'ticker': ticker,
-                    'df_insider_transactions': df_insider_transactions.to_dict() if
-                    df_insider_transactions is not None else None
+                    'df_insider_transactions': df_insider_transactions
                 }
                 logger.info(f"{ticker}: Shared dictionary updated successfully with insider transactions data.")
 
@@ -859,15 +1272,48 @@ class Scraper:
         finally:
             logger.info(f"{ticker}: Driver closed after insider transactions data scraping.")
 
+    @staticmethod
+    def run_processes(jobs, lock, max_processes):
+        """
+        Runs each scraping job in its own process, keeping up to max_processes processes running at once. A new process
+        is started as soon as any running one finishes, so a single slow ticker does not hold up the jobs queued behind
+        it.
+
+        :param jobs: The (scraping method, ticker, shared dictionary) triples to run, in the order they should start.
+        :type jobs: list of tuple
+        :param lock: A lock to synchronize access to shared resources in a multiprocessing environment.
+        :type lock: multiprocessing.Lock
+        :param max_processes: The maximum number of processes running at the same time.
+        :type max_processes: int
+        """
+        running = []
+        for scraping_method, ticker, shared_dict in jobs:
+            if len(running) >= max_processes:
+                # Block until at least one running process finishes, then reap every finished one
+                wait([process.sentinel for process in running])
+                for process in running:
+                    if not process.is_alive():
+                        process.join()
+                running = [process for process in running if process.is_alive()]
+
+            logger.info(f"{ticker}: Starting {scraping_method.__name__} process.")
+            process = multiprocessing.Process(target=scraping_method, args=(ticker, shared_dict, lock))
+            running.append(process)
+            process.start()
+
+        for process in running:
+            process.join()
+
     def scrape(self, ticker_string, target='fundamentals', max_processes_capacity=1):
         """
         Initiates the scraping process for multiple tickers using multiprocessing, allowing concurrent scraping of
         data for increased efficiency. The target can be fundamentals, holders, profile, insider transactions, or all.
 
         This method determines the number of processes to run based on the maximum processing capacity, then
-        dispatches separate processes for each batch of tickers. The WebDriver instances are managed to ensure
-        consistency across scraping sessions, preventing issues related to loading older versions of pages and
-        avoiding memory leaks.
+        dispatches a separate process for each ticker of each selected target, starting the next one whenever a running
+        one finishes. All targets share the same pool, so the quick request-based targets run alongside the slower
+        fundamentals. The WebDriver instances are managed to ensure consistency across scraping
+        sessions, preventing issues related to loading older versions of pages and avoiding memory leaks.
 
         :param ticker_string: A string of stock ticker symbols separated by spaces (e.g., 'AAPL MSFT GOOGL').
         :type ticker_string: str
@@ -883,37 +1329,62 @@ class Scraper:
         logger.info(f"Starting scrape process for tickers: {ticker_string} with target: {target}")
 
         # Determining the number of processes your computer should run to the number of available CPU cores
-        max_processes = floor(multiprocessing.cpu_count() * max_processes_capacity)
+        # Note: at least one process is always run, even when the capacity rounds down to zero cores
+        max_processes = max(1, floor(multiprocessing.cpu_count() * max_processes_capacity))
         logger.info(f"Max processes capacity set to: {max_processes}")
 
+        def shared_frame(data, key):
+            """
+            Returns a DataFrame handed back by a scraping process, or None if it is missing or has no columns. The
+            DataFrames are pickled into the shared dictionary as they are.
+            """
+            df = data.get(key)
+            return df if df is not None and not df.columns.empty else None
+
         with Manager() as manager:
-            shared_dict = manager.dict()
             lock = manager.Lock()  # Create a lock for synchronization
-            processes = []
-            tickers = ticker_string.split()
-
-            if any(x in target.lower() for x in ['fundamentals', 'all']):
-                logger.info(f"Starting fundamentals scraping for {len(tickers)} tickers.")
-                for i in range(0, len(tickers), max_processes):
-                    batch = tickers[i:i + max_processes]
-                    logger.info(f"Processing batch {i // max_processes + 1}: {batch}")
-                    for ticker in batch:
-                        process = multiprocessing.Process(
-                            target=self.fundamentals,
-                            args=(ticker, shared_dict, lock))
-                        processes.append(process)
-                        process.start()
-
-                    for process in processes:
-                        process.join()
-
-                    processes = []
-
-                logger.info(f"Fundamentals scraping completed for all tickers.")
+            # Repeated symbols are scraped only once, and each symbol is interned since it keys every dictionary below
+            tickers = [sys.intern(ticker) for ticker in dict.fromkeys(ticker_string.split())]
+
+            # Each selected target gets its own shared dictionary, since the targets of a ticker run concurrently
+            # (Note: fundamentals come first so that the slowest jobs start earliest)
+            target_methods = [(['fundamentals', 'all'], self.fundamentals),
+                              (['profile', 'all'], self.profile),
+                              (['holders', 'all'], self.holders),
+                              (['insider transactions', 'all'], self.insider_transactions)]
+            target = target.lower()
+            shared_dicts = {scraping_method.__name__: manager.dict() for keywords, scraping_method in target_methods
+                            if any(x in target for x in keywords)}
+
+            logger.info(f"Starting {', '.join(shared_dicts)} scraping for {len(tickers)} tickers.")
+            Scraper.run_processes([(scraping_method, ticker, shared_dicts[scraping_method.__name__])
+                                   for keywords, scraping_method in target_methods
+                                   if scraping_method.__name__ in shared_dicts
+                                   for ticker in tickers], lock, max_processes)
+            logger.info(f"Scraping completed for all tickers.")
+
+            # Copy the shared dictionaries back once, so that lookups do not go through the manager
+            scraped = {name: shared_dict.copy() for name, shared_dict in shared_dicts.items()}
+            scraped_tickers = {ticker for data in scraped.values() for ticker in data}
+
+            def scraped_data(name, ticker):
+                """
+                Returns the data stored for the ticker by the named target, or None if the ticker was not scraped at
+                all. A ticker that only failed this target gets an empty dictionary, so the attributes of this target
+                are still set (to None) on its Ticker instance.
+                """
+                if ticker in scraped[name]:
+                    return scraped[name][ticker]
+                if ticker in scraped_tickers:
+                    logger.warning(f"No {name} data found for ticker {ticker}")
+                    return {}
+                logger.warning(f"No data found for ticker {ticker} in shared_dict")
+                return None
 
+            if 'fundamentals' in scraped:
                 for ticker in tickers:
-                    if ticker in shared_dict:
-                        data = shared_dict[ticker]
+                    data = scraped_data('fundamentals', ticker)
+                    if data is not None:
                         if ticker not in self.ticker_instances:
                             self.ticker_instances[ticker] = Ticker(ticker=ticker)
 
@@ -922,42 +1393,18 @@ class Scraper:
                             name=data.get('name'),
                             change_intraday=data.get('change_intraday'),
                             change_afterhours=data.get('change_afterhours'),
-                            df_summary=pd.DataFrame(data.get('df_summary')) if data.get('df_summary') else None,
-                            df_statistics_valuations=pd.DataFrame(data.get('df_statistics_valuations')) if data.get(
-                                'df_statistics_valuations') else None,
-                            df_statistics_highlights=pd.DataFrame(data.get('df_statistics_highlights')) if data.get(
-                                'df_statistics_highlights') else None,
-                            df_income_statement=pd.DataFrame(data.get('df_income_statement')) if data.get(
-                                'df_income_statement') else None,
-                            df_balance_sheet=pd.DataFrame(data.get('df_balance_sheet')) if data.get(
-                                'df_balance_sheet') else None,
-                            df_cash_flow=pd.DataFrame(data.get('df_cash_flow')) if data.get('df_cash_flow') else None
+                            df_summary=shared_frame(data, 'df_summary'),
+                            df_statistics_valuations=shared_frame(data, 'df_statistics_valuations'),
+                            df_statistics_highlights=shared_frame(data, 'df_statistics_highlights'),
+                            df_income_statement=shared_frame(data, 'df_income_statement'),
+                            df_balance_sheet=shared_frame(data, 'df_balance_sheet'),
+                            df_cash_flow=shared_frame(data, 'df_cash_flow')
                         )
-                    else:
-                        logger.warning(f"No data found for ticker {ticker} in shared_dict")
-
-            if any(x in target.lower() for x in ['profile', 'all']):
-                logger.info(f"Starting profile scraping for {len(tickers)} tickers.")
-                for i in range(0, len(tickers), max_processes):
-                    batch = tickers[i:i + max_processes]
-                    logger.info(f"Processing batch {i // max_processes + 1}: {batch}")
-                    for ticker in batch:
-                        process = multiprocessing.Process(
-                            target=self.profile,
-                            args=(ticker, shared_dict, lock))
-                        processes.append(process)
-                        process.start()
-
-                    for process in processes:
-                        process.join()
-
-                    processes = []
-
-                logger.info(f"Profile scraping completed for all tickers.")
 
+            if 'profile' in scraped:
                 for ticker in tickers:
-                    if ticker in shared_dict:
-                        data = shared_dict[ticker]
+                    data = scraped_data('profile', ticker)
+                    if data is not None:
                         if ticker not in self.ticker_instances:
                             self.ticker_instances[ticker] = Ticker(ticker=ticker)
 
@@ -965,34 +1412,13 @@ class Scraper:
                             sector=data.get('sector'),
                             industry=data.get('industry'),
                             employees=data.get('employees'),
-                            df_key_executives=pd.DataFrame(data.get('df_key_executives'))
-                            if data.get('df_key_executives') else None
+                            df_key_executives=shared_frame(data, 'df_key_executives')
                         )
-                    else:
-                        logger.warning(f"No data found for ticker {ticker} in shared_dict")
-
-            if any(x in target.lower() for x in ['holders', 'all']):
-                logger.info(f"Starting holders scraping for {len(tickers)} tickers.")
-                for i in range(0, len(tickers), max_processes):
-                    batch = tickers[i:i + max_processes]
-                    logger.info(f"Processing batch {i // max_processes + 1}: {batch}")
-                    for ticker in batch:
-                        process = multiprocessing.Process(
-                            target=self.holders,
-                            args=(ticker, shared_dict, lock))
-                        processes.append(process)
-                        process.start()
-
-                    for process in processes:
-                        process.join()
-
-                    processes = []
-
-                logger.info(f"Holders scraping completed for all tickers.")
 
+            if 'holders' in scraped:
                 for ticker in tickers:
-                    if ticker in shared_dict:
-                        data = shared_dict[ticker]
+                    data = scraped_data('holders', ticker)
+                    if data is not None:
                         if ticker not in self.ticker_instances:
                             self.ticker_instances[ticker] = Ticker(ticker=ticker)
 
@@ -1002,40 +1428,17 @@ class Scraper:
                             institution_float_hold=data.get('institution_float_hold'),
                             num_institution_holding_shares=data.get('num_institution_holding_shares')
                         )
-                    else:
-                        logger.warning(f"No data found for ticker {ticker} in shared_dict")
-
-            if any(x in target.lower() for x in ['insider transactions', 'all']):
-                logger.info(f"Starting insider transactions scraping for {len(tickers)} tickers.")
-                for i in range(0, len(tickers), max_processes):
-                    batch = tickers[i:i + max_processes]
-                    logger.info(f"Processing batch {i // max_processes + 1}: {batch}")
-                    for ticker in batch:
-                        process = multiprocessing.Process(
-                            target=self.insider_transactions,
-                            args=(ticker, shared_dict, lock))
-                        processes.append(process)
-                        process.start()
-
-                    for process in processes:
-                        process.join()
-
-                    processes = []
-
-                logger.info(f"Insider transactions scraping completed for all tickers.")
 
+            if 'insider_transactions' in scraped:
                 for ticker in tickers:
-                    if ticker in shared_dict:
-                        data = shared_dict[ticker]
+                    data = scraped_data('insider_transactions', ticker)
+                    if data is not None:
                         if ticker not in self.ticker_instances:
                             self.ticker_instances[ticker] = Ticker(ticker=ticker)
 
                         self.ticker_instances[ticker].set_attr(
-                            df_insider_transactions=pd.DataFrame(data.get('df_insider_transactions'))
-                            if data.get('df_insider_transactions') else None,
+                            df_insider_transactions=shared_frame(data, 'df_insider_transactions'),
                         )
-                    else:
-                        logger.warning(f"No data found for ticker {ticker} in shared_dict")
 
             logger.info(f"Scraping process completed for all tickers with target: {target}.")
             return self.ticker_instances
@@ -1080,8 +1483,8 @@ class Analyzer:
 
         :param df_example: The DataFrame to search.
         :type df_example: pd.DataFrame
-        :param parameters: The parameter(s) to search for in the DataFrame. If a single string is provided, it is
-        converted to a list.
+        :param parameters: The parameter(s) to search for in the DataFrame, matched as plain substrings of the labels.
+        If a single string is provided, it is converted to a list.
         :type parameters: str or list of str
         :param output_column: The column index from which to retrieve the value.
         :type output_column: int
@@ -1090,7 +1493,9 @@ class Analyzer:
         :return: The value from the specified output column if found, otherwise None.
         :rtype: any
         """
-        logger.debug(f"Searching parameter '{parameters}'.")
+        # Note: this and the other conversion helpers run for every field of every ticker, so their debug messages are
+        # formatted lazily by the logging module, only when DEBUG is enabled
+        logger.debug("Searching parameter '%s'.", parameters)
 
         # Ensure parameters is a list; if a single string is provided, convert it to a list
         if isinstance(parameters, str):
@@ -1101,18 +1506,29 @@ class Analyzer:
             logger.warning(f"{df_example} is empty. No parameters found.")
             return None
 
+        # The labels are scanned directly; the tables are small, so building a boolean mask through the pandas string
+        # accessor on every call costs far more than the scan itself, which also stops at the first match
+        labels = df_example[search_column].to_numpy()
+
         # Iterate through each parameter and check if any matches in the search_column
+        # Note: parameters are plain text (e.g., "Price/Book"), so a substring check replaces regex matching
         for parameter in parameters:
-            matching_rows = df_example[df_example[search_column].str.contains(parameter, na=False)]
-            if not matching_rows.empty:
-                result_list = matching_rows.values.tolist()
-                if result_list and not any(x in result_list[0][output_column] for x in ['--', '-- ', '---']):
-                    return result_list[0][output_column].strip()
+            matching_position = next((position for position, label in enumerate(labels)
+                                      if isinstance(label, str) and parameter in label), None)
+            if matching_position is not None:
+                # Note: an out of range output_column still raises IndexError, which analyze() relies on
+                result = df_example.iat[matching_position, output_column]
+                if not any(x in result for x in ['--', '-- ', '---']):
+                    return result.strip()
 
         logger.warning(f"None of the parameters '{parameters}' found.")
         # Return None if no match is found for any of the parameters
         return None
 
+    # Multipliers of the abbreviations used by abbr_to_number and the translation table used by join_comma
+    abbreviation_multipliers = {'k': 10 ** 3, 'M': 10 ** 6, 'B': 10 ** 9, 'T': 10 ** 12}
+    comma_table = str.maketrans('', '', ',')
+
     # Use primarily for market cap and operating cash flow
     @staticmethod
     def abbr_to_number(number_string):
@@ -1126,19 +1542,18 @@ class Analyzer:
         :return: The numeric value as a float, or the original string if no abbreviation is found.
         :rtype: float or str
         """
-        logger.debug(f"Converting abbreviated number string '{number_string}' to float.")
+        logger.debug("Converting abbreviated number string '%s' to float.", number_string)
 
         if number_string is None:
             logger.warning('Number string is None.')
             return None
-        elif 'k' in number_string:
-            return float(number_string.replace('k', '')) * 10 ** 3
-        elif 'M' in number_string:
-            return float(number_string.replace('M', '')) * 10 ** 6
-        elif 'B' in number_string:
-            return float(number_string.replace('B', '')) * 10 ** 9
-        elif 'T' in number_string:
-            return float(number_string.replace('T', '')) * 10 ** 12
+
+        # Note: The abbreviation is always the last character, so one dictionary lookup replaces a substring scan per
+        # abbreviation
+        number_string_stripped = number_string.rstrip()
+        multiplier = Analyzer.abbreviation_multipliers.get(number_string_stripped[-1:])
+        if multiplier is not None:
+            return float(number_string_stripped[:-1]) * multiplier
         logger.warning(f"Unrecognized abbreviation in number string: {number_string}")
         try:
             return float(number_string)
@@ -1158,13 +1573,13 @@ class Analyzer:
         :return: The numeric value as a float, or None if the input is invalid.
         :rtype: float or None
         """
-        logger.debug(f"Converting comma-separated string '{comma_number}' to float.")
+        logger.debug("Converting comma-separated string '%s' to float.", comma_number)
 
         if comma_number in [None, '--', '-- ', '---']:
             logger.warning(f"Comma-separated number '{comma_number}' is not a valid number.")
             return None
         else:
-            return float(comma_number.replace(',', ''))
+            return float(comma_number.translate(Analyzer.comma_table))
 
     @staticmethod
     def calculate_growth_rate(current_value, previous_value, period):
@@ -1245,7 +1660,11 @@ class Analyzer:
 
         self.ticker_instances = scraper_output.copy()
 
-        if any(x in target.lower() for x in ['fundamentals', 'all']):
+        # Note: a ticker listed twice is only analyzed once, like in Scraper.scrape
+        tickers = list(dict.fromkeys(ticker_string.split()))
+        target = target.lower()
+
+        if any(x in target for x in ['fundamentals', 'all']):
             if financial_data_period.upper() in [2, '10K']:
                 self.period = 2
                 calculation_mode = '10K'
@@ -1255,7 +1674,7 @@ class Analyzer:
 
             logger.info(f"Analyzing fundamentals for tickers: {ticker_string}")
 
-            for ticker in ticker_string.split():
+            for ticker in tickers:
                 logger.info(f"Analyzing fundamentals for ticker: {ticker}")
 
                 # Retrieve the ticker instance safely
@@ -1636,10 +2055,10 @@ class Analyzer:
                 else:
                     logger.warning(f"{ticker}: No data found in scraper_output for this ticker.")
 
-        if any(x in target.lower() for x in ['profile', 'all']):
+        if any(x in target for x in ['profile', 'all']):
             logger.info(f"Analyzing profile data for tickers: {ticker_string}")
 
-            for ticker in ticker_string.split():
+            for ticker in tickers:
                 logger.info(f"Analyzing profile data for ticker: {ticker}")
 
                 # Pulling the DataFrames
@@ -1706,14 +2125,14 @@ class Analyzer:
                         cso_salary=cso_salary
                     )
 
-        if any(x in target.lower() for x in ['holders', 'all']):
+        if any(x in target for x in ['holders', 'all']):
             logger.info(f"Analyzing holders data for tickers: {ticker_string}")
             # Holders data usually doesn't require much processing, but add logs if any transformations are needed.
 
-        if any(x in target.lower() for x in ['insider transactions', 'all']):
+        if any(x in target for x in ['insider transactions', 'all']):
             logger.info(f"Analyzing insider transactions data for tickers: {ticker_string}")
 
-            for ticker in ticker_string.split():
+            for ticker in tickers:
                 logger.info(f"Analyzing insider transactions data for ticker: {ticker}")
 
                 # Pulling the DataFrames
@@ -1792,6 +2211,7 @@ class Compiler:
         """
 
         logger.info(f"Starting compilation for target: {target}")
+        target = target.lower()
 
         df_fundamentals = None
         df_profile = None
@@ -1817,26 +2237,26 @@ class Compiler:
 
         def extract_value(df_or_ticker_instance_input, column_name):
             """
-            Extracts a value from a pandas Series or DataFrame and replaces None with dashes ('---').
+            Extracts a value from a DataFrame row or a Ticker instance and replaces None with dashes ('---').
 
-            This function is designed to handle both DataFrames and Ticker instances. It retrieves the value from the
-            specified column in a DataFrame or the corresponding attribute in a Ticker instance. If the value is None
-            or NaN, it returns a placeholder ('---') for better visualization.
+            This function is designed to handle both DataFrame rows and Ticker instances. It retrieves the value from
+            the specified column of a row (a dictionary of column name to value) or the corresponding attribute in a
+            Ticker instance. If the value is None or NaN, it returns a placeholder ('---') for better visualization.
 
-            :param df_or_ticker_instance_input: The DataFrame or Ticker instance from which to extract the value.
-            :type df_or_ticker_instance_input: pd.DataFrame or Ticker
+            :param df_or_ticker_instance_input: The DataFrame row or Ticker instance from which to extract the value.
+            :type df_or_ticker_instance_input: dict or Ticker
             :param column_name: The name of the column or attribute to extract the value from.
             :type column_name: str
             :return: The extracted value, or '---' if the value was None or NaN.
             :rtype: str or float
             """
-            logger.debug(f"Extracting value for column '{column_name}'.")
+            # Note: formatted lazily, as this runs for every field of every ticker (see Analyzer.search_parameter)
+            logger.debug("Extracting value for column '%s'.", column_name)
 
-            # The case of DataFrame
-            if isinstance(df_or_ticker_instance_input, pd.DataFrame):
-                if column_name in df_or_ticker_instance_input.columns:
-                    value = df_or_ticker_instance_input[column_name].values[0]
-                    return replace_none_with_dash(value)
+            # The case of a DataFrame row
+            if isinstance(df_or_ticker_instance_input, dict):
+                if column_name in df_or_ticker_instance_input:
+                    return replace_none_with_dash(df_or_ticker_instance_input[column_name])
                 return '---'
 
             # The case of Ticker
@@ -1849,12 +2269,12 @@ class Compiler:
 
         # Generate list of tickers from analyzer_output
         if isinstance(analyzer_output_or_filepath, pd.DataFrame):
-            analyzer_output = analyzer_output_or_filepath.copy()
-            tickers = analyzer_output_or_filepath['ticker'].unique().tolist()
+            analyzer_output = analyzer_output_or_filepath  # Note: only read from, so no copy is needed
+            tickers = analyzer_output['ticker'].unique().tolist()
             logger.info(f"Loaded data from DataFrame with {len(tickers)} tickers.")
         elif isinstance(analyzer_output_or_filepath, str):
             try:
-                analyzer_output = pd.read_csv(analyzer_output_or_filepath)
+                analyzer_output = load(analyzer_output_or_filepath)
                 tickers = analyzer_output['ticker'].unique().tolist()
                 logger.info(f"Loaded data from file '{analyzer_output_or_filepath}' with {len(tickers)} tickers.")
             except pd.errors.EmptyDataError:
@@ -1869,7 +2289,19 @@ class Compiler:
         # Check if analyzer_output is a DataFrame
         is_dataframe = isinstance(analyzer_output, pd.DataFrame)
 
-        if target.lower() in ['fundamentals', 'all']:
+        # Pull every column out as an array once, then keep the first row of each ticker as a plain dictionary so that
+        # extracting a value is a dictionary lookup
+        ticker_rows = None
+        if is_dataframe:
+            column_values = {column: analyzer_output[column].to_numpy() for column in analyzer_output.columns}
+            first_positions = {}
+            for position, ticker in enumerate(column_values['ticker']):
+                if not pd.isna(ticker):
+                    first_positions.setdefault(ticker, position)
+            ticker_rows = {ticker: {column: values[position] for column, values in column_values.items()}
+                           for ticker, position in first_positions.items()}
+
+        if target in ['fundamentals', 'all']:
             """
             Compiles fundamental financial data into a DataFrame. This section extracts and organizes metrics like 
             intraday price changes, financial statement availability, valuation ratios, growth metrics, financial 
@@ -1880,8 +2312,8 @@ class Compiler:
             compiled_data = []
             for ticker in tickers:
                 if is_dataframe:
-                    ticker_obj = analyzer_output[analyzer_output['ticker'] == ticker]
-                    if ticker_obj.empty:
+                    ticker_obj = ticker_rows.get(ticker)
+                    if ticker_obj is None:
                         logger.warning(f"No data found for ticker {ticker} in analyzer_output")
                         continue
                 else:
@@ -1890,6 +2322,8 @@ class Compiler:
                         logger.warning(f"No data found for ticker {ticker} in analyzer_output")
                         continue
 
+                # The calculation mode labels four section headers, so look it up once per ticker
+                calculation_mode = extract_value(ticker_obj, 'calculation_mode')
                 compiled_data.append({
                     '   ••• INFORMATION •••   ': '••••••••••',
 
@@ -1913,35 +2347,36 @@ class Compiler:
                     'EPS': extract_value(ticker_obj, 'eps'),
                     'Diluted EPS': extract_value(ticker_obj, 'diluted_eps'),
 
-                    f'   ••• VALUATION - {extract_value(ticker_obj, "calculation_mode")} •••   ': '••••••••••',
+                    f'   ••• VALUATION - {calculation_mode} •••   ': '••••••••••',
                     'Price-to-Book': extract_value(ticker_obj, 'price_to_book'),
                     'Price-to-Sales': extract_value(ticker_obj, 'price_to_sales'),
                     'Price-to-Earnings': extract_value(ticker_obj, 'price_to_earnings'),
                     'Price-to-Cash Flow': extract_value(ticker_obj, 'price_to_cash_flow'),
 
-                    f'   ••• GROWTH - {extract_value(ticker_obj, "calculation_mode")} •••   ': '••••••••••',
+                    f'   ••• GROWTH - {calculation_mode} •••   ': '••••••••••',
                     'Revenue Growth': extract_value(ticker_obj, 'revenue_growth'),
                     'Operating Income Growth': extract_value(ticker_obj, 'operating_income_growth'),
                     'Net Income Growth': extract_value(ticker_obj, 'net_income_growth'),
                     'Diluted EPS Growth': extract_value(ticker_obj, 'diluted_eps_growth'),
 
-                    f'   ••• FINANCIAL STRENGTH - {extract_value(ticker_obj, "calculation_mode")} •••   ': '••••••••••',
+                    f'   ••• FINANCIAL STRENGTH - {calculation_mode} •••   ': '••••••••••',
                     'Quick Ratio': extract_value(ticker_obj, 'quick_ratio'),
                     'Current Ratio': extract_value(ticker_obj, 'current_ratio'),
                     'Interest Coverage': extract_value(ticker_obj, 'interest_coverage'),
                     'Debt/Equity': extract_value(ticker_obj, 'debt_to_equity'),
 
-                    f'   ••• PROFITABILITY - {extract_value(ticker_obj, "calculation_mode")} •••   ': '••••••••••',
+                    f'   ••• PROFITABILITY - {calculation_mode} •••   ': '••••••••••',
                     'Return on Assets': extract_value(ticker_obj, 'return_on_assets'),
                     'Return on Equity': extract_value(ticker_obj, 'return_on_equity'),
                     'Return on Invested Capital': extract_value(ticker_obj, 'return_on_invested_capital'),
                     'Profit Margin': extract_value(ticker_obj, 'profit_margin')
                 })
 
-            df_fundamentals = pd.DataFrame(compiled_data).transpose()
+            # Note: building the frame as a single object block lets the transpose flip it without reblocking columns
+            df_fundamentals = pd.DataFrame(compiled_data, dtype=object).transpose()
             logger.info(f'Fundamentals compilation completed.')
 
-        if target.lower() in ['profile', 'all']:
+        if target in ['profile', 'all']:
             """
             Compiles company profile data into a DataFrame. This section focuses on key executive information, including 
             names, birth years, and salaries of top executives like the Chairman, CEO, CFO, and others. The DataFrame 
@@ -1951,8 +2386,8 @@ class Compiler:
             profile_data = []
             for ticker in tickers:
                 if is_dataframe:
-                    ticker_obj = analyzer_output[analyzer_output['ticker'] == ticker]
-                    if ticker_obj.empty:
+                    ticker_obj = ticker_rows.get(ticker)
+                    if ticker_obj is None:
                         logger.warning(f"No data found for ticker {ticker} in analyzer_output")
                         continue
                 else:
@@ -1989,10 +2424,10 @@ class Compiler:
                                                  f"${extract_value(ticker_obj, 'cso_salary')}"
                 })
 
-            df_profile = pd.DataFrame(profile_data).transpose()
+            df_profile = pd.DataFrame(profile_data, dtype=object).transpose()
             logger.info(f"Profile compilation completed.")
 
-        if target.lower() in ['holders', 'all']:
+        if target in ['holders', 'all']:
             """
             Compiles major holders data into a DataFrame. This section extracts and organizes information about insider 
             shareholding, institutional shareholding, and the number of institutions holding shares. The DataFrame is 
@@ -2002,8 +2437,8 @@ class Compiler:
             holders_data = []
             for ticker in tickers:
                 if is_dataframe:
-                    ticker_obj = analyzer_output[analyzer_output['ticker'] == ticker]
-                    if ticker_obj.empty:
+                    ticker_obj = ticker_rows.get(ticker)
+                    if ticker_obj is None:
                         logger.warning(f"No data found for ticker {ticker} in analyzer_output")
                         continue
                 else:
@@ -2020,10 +2455,10 @@ class Compiler:
                     '# of Institutions Holding Shares': extract_value(ticker_obj, 'num_institution_holding_shares')
                 })
 
-            df_holders = pd.DataFrame(holders_data).transpose()
+            df_holders = pd.DataFrame(holders_data, dtype=object).transpose()
             logger.info(f'Holders compilation completed.')
 
-        if target.lower() in ['insider transactions', 'all']:
+        if target in ['insider transactions', 'all']:
             """
             Compiles insider transactions data into a DataFrame. This section focuses on insider trading activities, 
             including net shares purchased, sold, and the overall net change. The DataFrame is structured to highlight 
@@ -2033,8 +2468,8 @@ class Compiler:
             insider_transactions_data = []
             for ticker in tickers:
                 if is_dataframe:
-                    ticker_obj = analyzer_output[analyzer_output['ticker'] == ticker]
-                    if ticker_obj.empty:
+                    ticker_obj = ticker_rows.get(ticker)
+                    if ticker_obj is None:
                         logger.warning(f"No data found for ticker {ticker} in analyzer_output")
                         continue
                 else:
@@ -2055,7 +2490,7 @@ class Compiler:
                     'Net Transactions': extract_value(ticker_obj, 'net_transactions')
                 })
 
-            df_insider_transactions = pd.DataFrame(insider_transactions_data).transpose()
+            df_insider_transactions = pd.DataFrame(insider_transactions_data, dtype=object).transpose()
             logger.info(f"Insider transactions compilation completed.")
 
         return [df_fundamentals, df_profile, df_holders, df_insider_transactions]
@@ -2073,6 +2508,103 @@ class Exporter:
     structured DataFrame.
     """
 
+    # Attributes exported for each ticker, in column order
+    export_fields = (
+        # Information
+        'ticker',
+
+        # Intraday Data
+        'price',
+        'name',
+        'change_intraday',
+        'change_afterhours',
+
+        # Data Availability
+        'summary_availability',
+        'fs_availability',
+        'latest_10Q',
+        'latest_10K',
+
+        # Overview
+        'forward_dividend_and_yield',
+        'market_cap',
+        'eps',
+        'diluted_eps',
+
+        # Valuation
+        'price_to_book',
+        'price_to_sales',
+        'price_to_earnings',
+        'price_to_cash_flow',
+
+        # Growth
+        'revenue_growth',
+        'operating_income_growth',
+        'net_income_growth',
+        'diluted_eps_growth',
+
+        # Financial Strength
+        'quick_ratio',
+        'current_ratio',
+        'interest_coverage',
+        'debt_to_equity',
+
+        # Profitability
+        'return_on_assets',
+        'return_on_equity',
+        'return_on_invested_capital',
+        'profit_margin',
+
+        # Additional Financial Data
+        'operating_cash_flow',
+        'market_cap_float',
+        'tangible_book_value',
+        'total_assets',
+        'calculation_mode',
+
+        # Executive Information (Profile Data)
+        'chairman',
+        'chairman_year',
+        'chairman_salary',
+        'director',
+        'director_year',
+        'director_salary',
+        'ceo',
+        'ceo_year',
+        'ceo_salary',
+        'cfo',
+        'cfo_year',
+        'cfo_salary',
+        'clo',
+        'clo_year',
+        'clo_salary',
+        'cmo',
+        'cmo_year',
+        'cmo_salary',
+        'coo',
+        'coo_year',
+        'coo_salary',
+        'cso',
+        'cso_year',
+        'cso_salary',
+
+        # Insider Transactions
+        'total_insider_shares_held',
+        'net_shares_purchased',
+        'net_shares_sold',
+        'net_shares_change',
+        'percent_net_shares_change',
+        'purchase_transactions',
+        'sell_transactions',
+        'net_transactions',
+
+        # Holders Data
+        'insider_shares_hold',
+        'institution_shares_hold',
+        'institution_float_hold',
+        'num_institution_holding_shares'
+    )
+
     @staticmethod
     def export_to_csv(ticker_string, analyzer_instance, filepath, mode='write'):
         """
@@ -2092,129 +2624,52 @@ class Exporter:
         :rtype: None
         """
         logger.info(f'Starting export to CSV for tickers: {ticker_string}')
-        data_to_export = []
-
-        # Split the ticker_string into individual tickers
-        tickers = ticker_string.split()
-
-        # Iterate through each ticker in the ticker_string
-        for ticker in tickers:
-            ticker_obj = analyzer_instance.get(ticker)
-            if ticker_obj:
-                logger.info(f"Processing {ticker} for CSV export.")
-                ticker_data = {
-                    # Information
-                    'ticker': ticker_obj.get_attr('ticker'),
-
-                    # Intraday Data
-                    'price': ticker_obj.get_attr('price'),
-                    'name': ticker_obj.get_attr('name'),
-                    'change_intraday': ticker_obj.get_attr('change_intraday'),
-                    'change_afterhours': ticker_obj.get_attr('change_afterhours'),
-
-                    # Data Availability
-                    'summary_availability': ticker_obj.get_attr('summary_availability'),
-                    'fs_availability': ticker_obj.get_attr('fs_availability'),
-                    'latest_10Q': ticker_obj.get_attr('latest_10Q'),
-                    'latest_10K': ticker_obj.get_attr('latest_10K'),
-
-                    # Overview
-                    'forward_dividend_and_yield': ticker_obj.get_attr('forward_dividend_and_yield'),
-                    'market_cap': ticker_obj.get_attr('market_cap'),
-                    'eps': ticker_obj.get_attr('eps'),
-                    'diluted_eps': ticker_obj.get_attr('diluted_eps'),
-
-                    # Valuation
-                    'price_to_book': ticker_obj.get_attr('price_to_book'),
-                    'price_to_sales': ticker_obj.get_attr('price_to_sales'),
-                    'price_to_earnings': ticker_obj.get_attr('price_to_earnings'),
-                    'price_to_cash_flow': ticker_obj.get_attr('price_to_cash_flow'),
-
-                    # Growth
-                    'revenue_growth': ticker_obj.get_attr('revenue_growth'),
-                    'operating_income_growth': ticker_obj.get_attr('operating_income_growth'),
-                    'net_income_growth': ticker_obj.get_attr('net_income_growth'),
-                    'diluted_eps_growth': ticker_obj.get_attr('diluted_eps_growth'),
-
-                    # Financial Strength
-                    'quick_ratio': ticker_obj.get_attr('quick_ratio'),
-                    'current_ratio': ticker_obj.get_attr('current_ratio'),
-                    'interest_coverage': ticker_obj.get_attr('interest_coverage'),
-                    'debt_to_equity': ticker_obj.get_attr('debt_to_equity'),
-
-                    # Profitability
-                    'return_on_assets': ticker_obj.get_attr('return_on_assets'),
-                    'return_on_equity': ticker_obj.get_attr('return_on_equity'),
-                    'return_on_invested_capital': ticker_obj.get_attr('return_on_invested_capital'),
-                    'profit_margin': ticker_obj.get_attr('profit_margin'),
-
-                    # Additional Financial Data
-                    'operating_cash_flow': ticker_obj.get_attr('operating_cash_flow'),
-                    'market_cap_float': ticker_obj.get_attr('market_cap_float'),
-                    'tangible_book_value': ticker_obj.get_attr('tangible_book_value'),
-                    'total_assets': ticker_obj.get_attr('total_assets'),
-                    'calculation_mode': ticker_obj.get_attr('calculation_mode'),
-
-                    # Executive Information (Profile Data)
-                    'chairman': ticker_obj.get_attr('chairman'),
-                    'chairman_year': ticker_obj.get_attr('chairman_year'),
-                    'chairman_salary': ticker_obj.get_attr('chairman_salary'),
-                    'director': ticker_obj.get_attr('director'),
-                    'director_year': ticker_obj.get_attr('director_year'),
-                    'director_salary': ticker_obj.get_attr('director_salary'),
-                    'ceo': ticker_obj.get_attr('ceo'),
-                    'ceo_year': ticker_obj.get_attr('ceo_year'),
-                    'ceo_salary': ticker_obj.get_attr('ceo_salary'),
-                    'cfo': ticker_obj.get_attr('cfo'),
-                    'cfo_year': ticker_obj.get_attr('cfo_year'),
-                    'cfo_salary': ticker_obj.get_attr('cfo_salary'),
-                    'clo': ticker_obj.get_attr('clo'),
-                    'clo_year': ticker_obj.get_attr('clo_year'),
-                    'clo_salary': ticker_obj.get_attr('clo_salary'),
-                    'cmo': ticker_obj.get_attr('cmo'),
-                    'cmo_year': ticker_obj.get_attr('cmo_year'),
-                    'cmo_salary': ticker_obj.get_attr('cmo_salary'),
-                    'coo': ticker_obj.get_attr('coo'),
-                    'coo_year': ticker_obj.get_attr('coo_year'),
-                    'coo_salary': ticker_obj.get_attr('coo_salary'),
-                    'cso': ticker_obj.get_attr('cso'),
-                    'cso_year': ticker_obj.get_attr('cso_year'),
-                    'cso_salary': ticker_obj.get_attr('cso_salary'),
-
-                    # Insider Transactions
-                    'total_insider_shares_held': ticker_obj.get_attr('total_insider_shares_held'),
-                    'net_shares_purchased': ticker_obj.get_attr('net_shares_purchased'),
-                    'net_shares_sold': ticker_obj.get_attr('net_shares_sold'),
-                    'net_shares_change': ticker_obj.get_attr('net_shares_change'),
-                    'percent_net_shares_change': ticker_obj.get_attr('percent_net_shares_change'),
-                    'purchase_transactions': ticker_obj.get_attr('purchase_transactions'),
-                    'sell_transactions': ticker_obj.get_attr('sell_transactions'),
-                    'net_transactions': ticker_obj.get_attr('net_transactions'),
-
-                    # Holders Data
-                    'insider_shares_hold': ticker_obj.get_attr('insider_shares_hold'),
-                    'institution_shares_hold': ticker_obj.get_attr('institution_shares_hold'),
-                    'institution_float_hold': ticker_obj.get_attr('institution_float_hold'),
-                    'num_institution_holding_shares': ticker_obj.get_attr('num_institution_holding_shares')
-                }
-                data_to_export.append(ticker_data)
-            else:
-                logger.warning(f"No data found for ticker {ticker} in analyzer_instance")
 
-        # Convert the new data to a DataFrame
-        df_new_data = pd.DataFrame(data_to_export)
+        # Split the ticker_string into individual tickers (a ticker listed twice is only exported once)
+        tickers = dict.fromkeys(ticker_string.split())
+
+        def export_value(value):
+            # Missing values (None, or NaN such as a NaN cell found by search_parameter) are written as empty fields,
+            # as DataFrame.to_csv() writes them
+            return '' if pd.api.types.is_scalar(value) and pd.isna(value) else value
+
+        def export_rows():
+            # Yields the row of each ticker in the ticker_string as it is processed, so that no intermediate columns
+            # have to be collected and transposed
+            for ticker in tickers:
+                ticker_obj = analyzer_instance.get(ticker)
+                if ticker_obj:
+                    logger.info(f"Processing {ticker} for CSV export.")
+                    yield [export_value(ticker_obj.get_attr(field)) for field in Exporter.export_fields]
+                else:
+                    logger.warning(f"No data found for ticker {ticker} in analyzer_instance")
+
+        def write_csv(header, rows):
+            # Both modes write the file through the csv module, so that the same rows always produce the same bytes;
+            # the rows are gathered in a 64 KiB write buffer so the file receives few large writes
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 16) as csv_file:
+                writer = csv.writer(csv_file, lineterminator=os.linesep)
+                writer.writerow(header)
+                writer.writerows(rows)
 
         if mode == 'append' and os.path.exists(filepath):
             logger.info(f"Appending to existing CSV file {filepath}.")
-            df_existing = pd.read_csv(filepath)
+            # Note: the existing values are read as the strings they were written as, so that they are written back
+            # unchanged (e.g., an integer column with a missing value is not turned into floats)
+            df_existing = read_csv(filepath, as_text=True)
+
+            # Convert the new data to a DataFrame (of objects, so that aligning it does not turn integers into floats)
+            df_new_data = pd.DataFrame(list(export_rows()), columns=list(Exporter.export_fields), dtype=object)
 
             # Combine new data with the existing data, aligning columns
             df_combined = df_existing.set_index('ticker').combine_first(df_new_data.set_index('ticker')).reset_index()
 
-            # Save the updated DataFrame back to the CSV file
-            df_combined.to_csv(filepath, index=False)
+            # Save the updated rows back to the CSV file
+            write_csv(df_combined.columns, ([export_value(value) for value in row]
+                                            for row in df_combined.itertuples(index=False, name=None)))
             logger.info(f"Data successfully appended to {filepath}")
         else:
             # If mode is 'write' or file does not exist, create or overwrite the CSV file
-            df_new_data.to_csv(filepath, index=False)
+            # Note: nothing needs aligning here, so each row is streamed to the file as soon as it is built
+            write_csv(Exporter.export_fields, export_rows())
             logger.info(f"Data successfully written to {filepath}")
@@ -10,19 +10,23 @@ import FiScrape_Core
 import logging
 import time
 
+import pandas as pd
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.ERROR)  # Enable debug logging
 
     # Your inputs
-    tickers = input(str('Input your tickers separated by spaces here (e.g. AAPL AXP V): ')).upper()
-    targets = (input(str("Choose between 'fundamentals,' 'holders,' 'insider transactions,' 'profile,' or 'all': "))
+    tickers = input('Input your tickers separated by spaces here (e.g. AAPL AXP V): ').upper()
+    targets = (input("Choose between 'fundamentals,' 'holders,' 'insider transactions,' 'profile,' or 'all': ")
                .lower())
-    export_path = input(str('Choose location for export (e.g. full_output.csv): '))
-    recommendation = input(str('yes or no recommendation? ')).lower()
+    export_path = input('Choose location for export (e.g. full_output.csv): ')
+    recommendation = input('yes or no recommendation? ').lower()
+    # Statistics and financial statements only change with new filings, so they can be reused for the rest of the day
+    cache = input('yes or no cache statistics and financials pages for the day? ').lower()
 
     # Initialize all modules used
-    start = time.time()
-    scraper = FiScrape_Core.Scraper()
+    start = time.perf_counter()
+    scraper = FiScrape_Core.Scraper(cache_dir='.fiscrape_cache' if cache == 'yes' else None)
     analyzer = FiScrape_Core.Analyzer()
     exporter = FiScrape_Core.Exporter()
     compiler = FiScrape_Core.Compiler()
@@ -46,8 +50,12 @@ if __name__ == '__main__':
 
     # Import and analyze
     compiled = compiler.compile(export_path, targets)
-    print(compiled)
 
-    end = time.time()
+    # Show every row and column of the compiled tables (only while printing, not for the rest of the run)
+    with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.width', None,
+                           'display.max_colwidth', None, 'display.float_format', '{:.0f}'.format):
+        print(compiled)
+
+    end = time.perf_counter()
 
     print(f'This scraping took {end - start} seconds')
\ No newline at end of file
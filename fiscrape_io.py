@@ -0,0 +1,58 @@
+"""
+This module provides the CSV reading used by the Compiler and Exporter classes.
+"""
+
+import functools
+import os
+
+import pandas as pd
+
+
+def read_csv(filepath, as_text=False):
+    """
+    Reads a CSV file exported by FiScrape into a DataFrame with pandas' C engine.
+
+    The pyarrow engine is not used, as it infers types differently (e.g., ISO dates become date objects), which
+    would make the values read back from an export depend on whether pyarrow happens to be installed.
+
+    :param filepath: The path of the CSV file to read.
+    :type filepath: str
+    :param as_text: Whether to read every field as the string it was written as (with empty fields as missing
+    values) instead of inferring the column types, so that the values can be written back unchanged.
+    :type as_text: bool, optional
+    :return: A DataFrame containing the contents of the CSV file.
+    :rtype: pd.DataFrame
+    """
+    # Note: memory_map lets the C tokenizer scan the file straight from the page cache, but an empty file cannot be
+    # mapped and has to go through the regular reader to raise pd.errors.EmptyDataError
+    if as_text:
+        return pd.read_csv(filepath, engine='c', dtype=str, keep_default_na=False, na_values=[''],
+                           memory_map=os.path.getsize(filepath) > 0)
+    return pd.read_csv(filepath, engine='c', low_memory=False, memory_map=os.path.getsize(filepath) > 0)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_load(filepath, mtime_ns, size):
+    """
+    Parses a CSV file once per (filepath, mtime_ns, size) key. The modification time and size are only part of the key
+    so that a file rewritten since the last parse is read again. The cached DataFrame is never handed out (see load).
+    """
+    return read_csv(filepath)
+
+
+def load(filepath):
+    """
+    Loads a CSV file exported by FiScrape, reusing the previously parsed DataFrame if the file has not changed since.
+    Each call returns its own copy, so callers may modify it.
+
+    A change is detected through the file's modification time and size. On a file system with coarse timestamps, a
+    rewrite within the same timestamp tick that keeps the file size is not detected, and the previous contents are
+    returned.
+
+    :param filepath: The path of the CSV file to load.
+    :type filepath: str
+    :return: A DataFrame containing the contents of the CSV file.
+    :rtype: pd.DataFrame
+    """
+    stat = os.stat(filepath)
+    return _cached_load(os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size).copy()